@@ -1,8 +1,15 @@
 # sternfield_timetable_bot.py
 import streamlit as st
+import pandas as pd
+import bisect
 import json
-from datetime import datetime, timedelta
+import functools
+from datetime import datetime, timedelta, time as dt_time
+from typing import NamedTuple
 import time as py_time
+import atexit
+import os
+import tempfile
 from threading import Thread, Event
 import re
 import pytz
@@ -14,6 +21,21 @@ try:
 except Exception:
     PLYER_AVAILABLE = False
 
+# Prefer orjson for JSON parsing/serialization (several times faster); fall
+# back to the stdlib so the app still runs without it.
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+
+    def _json_dumps(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_dumps(obj):
+        return json.dumps(obj, indent=2).encode("utf-8")
+
 # --- Configuration & Data Loading ---
 TIMETABLE_FILE = "timetable_data.json"
 TEACHER_ASSIGNMENTS_FILE = "teacher_assignments.json"
@@ -22,6 +44,17 @@ NOTIFICATION_WINDOW_MINUTES = 5  # Notify X minutes before class starts
 # Set Lagos timezone
 LAGOS_TZ = pytz.timezone('Africa/Lagos')
 
+# Day names indexed by datetime.weekday(); avoids strftime's locale machinery
+_DAYS = ("MONDAY", "TUESDAY", "WEDNESDAY", "THURSDAY", "FRIDAY", "SATURDAY", "SUNDAY")
+
+# Display form of the day keys; a dict lookup beats re-title-casing the same
+# handful of names on every rerun
+DAY_TITLE = {day: day.title() for day in _DAYS}
+
+def day_title(day):
+    """Title-case day name for display, via table lookup on the fixed day set."""
+    return DAY_TITLE.get(day.upper(), day)
+
 def load_data(file_name):
     """
     Loads JSON data from a local file.
@@ -31,41 +64,121 @@ def load_data(file_name):
     Handles missing file and invalid JSON gracefully.
     """
     try:
-        with open(file_name, "r", encoding="utf-8") as f:
+        with open(file_name, "rb") as f:
             content = f.read().strip()
             if not content:
                 return [] if file_name == TIMETABLE_FILE else {}
-            return json.loads(content)
+            return _json_loads(content)
     except FileNotFoundError:
         return [] if file_name == TIMETABLE_FILE else {}
-    except json.JSONDecodeError:
+    except ValueError:  # covers both json and orjson decode errors
         st.error(f"Error: {file_name} contains invalid JSON.")
         return [] if file_name == TIMETABLE_FILE else {}
 
-def save_assignments(assignments):
-    """Saves teacher assignments to a local file (pretty-printed)."""
-    try:
-        with open(TEACHER_ASSIGNMENTS_FILE, "w", encoding="utf-8") as f:
-            json.dump(assignments, f, indent=2)
-    except Exception as e:
-        st.error(f"Failed to save assignments: {e}")
+# Snapshot of the assignments index for the reminder thread. Streamlit does
+# not support st.session_state access from background threads, so the thread
+# reads only this shared copy, which save_assignments keeps in sync. The
+# dict itself lives behind cache_resource: each script run is a fresh module,
+# and a plain global would leave long-lived threads holding a stale dict no
+# later run's save ever touches.
+@st.cache_resource(show_spinner=False)
+def _assignments_snapshot():
+    return {}
 
-# Load initial data (module level)
-TIMETABLE = load_data(TIMETABLE_FILE)
+_ASSIGNMENTS_SNAPSHOT = _assignments_snapshot()
 
-# Ensure session_state defaults exist before UI code runs
-if "assignments" not in st.session_state:
-    st.session_state.assignments = load_data(TEACHER_ASSIGNMENTS_FILE) or {}
-if "checker_thread" not in st.session_state:
-    st.session_state.checker_thread = None
-if "checker_stop_event" not in st.session_state:
-    st.session_state.checker_stop_event = None
-if "last_checked_teacher" not in st.session_state:
-    st.session_state.last_checked_teacher = None
-if "reg_teacher_name" not in st.session_state:
-    st.session_state.reg_teacher_name = ""
-if "show_full_schedule" not in st.session_state:
-    st.session_state.show_full_schedule = False
+def _build_assignments_index(assignments):
+    """
+    Per teacher: class -> frozenset of assigned subjects (uppercased).
+    Built once at load and rebuilt on save, so the schedule helpers and the
+    reminder thread never re-normalize assignment strings per call.
+    """
+    index = {}
+    for teacher, teacher_assignments in assignments.items():
+        by_class = {}
+        for a in teacher_assignments:
+            try:
+                by_class.setdefault(a["Class"], set()).add(a["Subject"].strip().upper())
+            except Exception:
+                continue
+        index[teacher] = {cls: frozenset(subjects) for cls, subjects in by_class.items()}
+    return index
+
+def _build_assignment_key_sets(assignments):
+    """Per teacher: set of (Class, Subject) pairs for O(1) duplicate checks."""
+    return {
+        teacher: {(a.get("Class"), a.get("Subject")) for a in teacher_assignments}
+        for teacher, teacher_assignments in assignments.items()
+    }
+
+def _assignments_writer(mailbox, save_event, stop_event):
+    """
+    Background loop that flushes queued assignment edits to disk. Writes go
+    to a temp file followed by os.replace, so a crash mid-write or a second
+    Streamlit session can never leave a torn JSON file, and unchanged
+    payloads are skipped entirely.
+    """
+    last_written = None
+    while not stop_event.is_set():
+        save_event.wait(2)
+        if not save_event.is_set():
+            continue
+        save_event.clear()
+        payload = mailbox.pop("data", None)
+        if payload is None or payload == last_written:
+            continue
+        try:
+            fd, tmp_path = tempfile.mkstemp(
+                dir=os.path.dirname(os.path.abspath(TEACHER_ASSIGNMENTS_FILE))
+            )
+            with os.fdopen(fd, "wb") as f:
+                f.write(_json_dumps(payload))
+            os.replace(tmp_path, TEACHER_ASSIGNMENTS_FILE)
+            last_written = payload
+            # Only now is the file safe to re-read: clearing before the
+            # replace would let a refresh in the flush window resurrect the
+            # stale on-disk copy
+            load_assignments_raw.clear()
+        except Exception as e:
+            # Can't surface st.error from a thread; log instead
+            print(f"[Assignments] Failed to save: {e}")
+
+@st.cache_resource(show_spinner=False)
+def _start_assignments_writer():
+    """
+    Start the process-wide assignments writer thread once and return the
+    (mailbox, save_event) pair it waits on. Both live inside this factory —
+    module globals would be rebuilt on every script run, leaving the thread
+    watching the first run's objects while later runs wrote to new ones.
+    """
+    mailbox = {}
+    save_event = Event()
+    stop_event = Event()
+    t = Thread(target=_assignments_writer, args=(mailbox, save_event, stop_event), daemon=True)
+    t.start()
+    return mailbox, save_event
+
+def save_assignments(assignments):
+    """
+    Queues teacher assignments for persistence (pretty-printed JSON).
+    The click handler only refreshes the in-memory indexes and flags the
+    background writer, so the UI never waits on disk I/O.
+    """
+    index = _build_assignments_index(assignments)
+    st.session_state.assignments_index = index
+    st.session_state.assignments_set = _build_assignment_key_sets(assignments)
+    st.session_state.teacher_names_sorted = sorted(assignments.keys())
+    _ASSIGNMENTS_SNAPSHOT.clear()
+    _ASSIGNMENTS_SNAPSHOT.update(index)
+    _clear_schedule_caches()
+    mailbox, save_event = _start_assignments_writer()
+    # Hand the writer its own copy so later UI edits can't race the dump;
+    # the writer clears the load_assignments_raw cache once bytes hit disk
+    mailbox["data"] = {
+        teacher: [dict(a) for a in teacher_assignments]
+        for teacher, teacher_assignments in assignments.items()
+    }
+    save_event.set()
 
 # ----------------- Time Conversion Functions -----------------
 def get_current_time():
@@ -78,82 +191,279 @@ def get_current_time_str():
 
 def get_current_day():
     """Get current day in Lagos timezone"""
-    return get_current_time().strftime("%A").upper()
+    return _DAYS[get_current_time().weekday()]
 
+@functools.lru_cache(maxsize=512)
 def convert_to_24hour(time_str):
     """
     Convert 12-hour format time to 24-hour format
-    Assumes: 
+    Assumes:
     - Times before 7:00 are PM (afternoon sessions)
     - Times 7:00 and after are AM (morning sessions)
+    Cached: the same handful of timetable/user time strings recur constantly.
     """
+    # Fast path for canonical "HH:MM": two digit checks and some integer
+    # math instead of split + int() + re-formatting.
+    if isinstance(time_str, str) and len(time_str) == 5 and time_str[2] == ':' and time_str[:2].isdigit():
+        hours = (ord(time_str[0]) - 48) * 10 + (ord(time_str[1]) - 48)
+        if hours < 7:
+            return f"{hours + 12:02d}:{time_str[3:]}"
+        return time_str
+    # General path for odd widths like "9:30"
     try:
         if ':' in time_str:
             hours, minutes = time_str.split(':')
             hours = int(hours)
             minutes = int(minutes)
-            
+
             # If time is before 7:00, assume it's PM (afternoon)
             if hours < 7:
                 hours += 12
-                
+
             return f"{hours:02d}:{minutes:02d}"
         else:
             return time_str
     except Exception:
         return time_str
 
+@functools.lru_cache(maxsize=256)
 def format_time_12hr(time_str):
     """
     Convert time string to 12-hour format with correct AM/PM
     Handles both 12-hour and 24-hour format inputs
     """
-    try:
-        # First convert to 24-hour format for consistent processing
-        time_24hr = convert_to_24hour(time_str)
-        
-        if ':' in time_24hr:
-            hours, minutes = time_24hr.split(':')
-            hours = int(hours)
-            minutes = int(minutes)
-        else:
-            return time_str  # Return original if format is wrong
-        
-        # Determine AM/PM and convert hours
-        if hours == 0:
-            period = "AM"
-            display_hours = 12
-        elif hours < 12:
-            period = "AM"
-            display_hours = hours
-        elif hours == 12:
-            period = "PM"
-            display_hours = 12
-        else:
-            period = "PM"
-            display_hours = hours - 12
-        
-        return f"{display_hours}:{minutes:02d} {period}"
-    except Exception as e:
+    t = parse_hhmm(time_str)
+    if t is None:
         return time_str  # Return original if parsing fails
+    return format_time_12hr_from_time(t)
+
+def format_time_12hr_from_time(t):
+    """
+    Format a datetime.time as 12-hour display directly, for internal paths
+    where the parsed time already exists (no string splitting/parsing).
+    """
+    hours = t.hour
+    period = "AM" if hours < 12 else "PM"
+    display_hours = 12 if hours % 12 == 0 else hours % 12
+    return f"{display_hours}:{t.minute:02d} {period}"
 
-def format_time_period(start_str, end_str):
-    """Format a time period with correct AM/PM"""
-    return f"{format_time_12hr(start_str)} - {format_time_12hr(end_str)}"
+def format_time_period_from_times(start_t, end_t):
+    """Format a time period from pre-parsed datetime.time objects"""
+    return f"{format_time_12hr_from_time(start_t)} - {format_time_12hr_from_time(end_t)}"
 
 def get_day_from_string(day_str):
     """Convert day string to proper day name"""
     day_str = day_str.upper()
-    
+
     if day_str == "TODAY":
         return get_current_day()
     elif day_str == "TOMORROW":
         tomorrow = get_current_time() + timedelta(days=1)
-        return tomorrow.strftime("%A").upper()
+        return _DAYS[tomorrow.weekday()]
     else:
         return day_str
 
+# ----------------- Timetable Preprocessing -----------------
+# Subjects matching this are breaks/whole-school activities, not teaching periods
+_BREAK_RE = re.compile(r"BREAK|ASSEMBLY|CLINIC|TEA|LIBRARY|PRACTICAL|CLUB|SPORT|LUNCH|STUDY|REMEDIAL")
+
+class TTRow(NamedTuple):
+    """One timetable period with parse/normalize work done once at load time."""
+    day: str
+    class_name: str
+    subject: str
+    start_str: str
+    end_str: str
+    period: str
+    day_upper: str
+    class_upper: str
+    subject_upper: str
+    subject_parts: tuple
+    start_time: object  # datetime.time, or None if the source string was unparseable
+    end_time: object
+    start_display: str  # pre-rendered 12-hour display form, e.g. "1:25 PM"
+    end_display: str
+    is_break: bool
+
+@functools.lru_cache(maxsize=4096)
+def parse_hhmm(time_str):
+    """
+    Parse an HH:MM string (school 12-hour convention) to datetime.time, or
+    None if invalid. Cached: the same strings (timetable cells, user-typed
+    times re-submitted on every rerun) recur constantly.
+    """
+    try:
+        # Manual int parse: ~10x cheaper than strptime's format machinery
+        hours, _, minutes = convert_to_24hour(time_str).partition(":")
+        return dt_time(int(hours), int(minutes))
+    except Exception:
+        return None
+
+def _preprocess_timetable(raw_items):
+    """
+    Convert raw timetable dicts into TTRow tuples with times parsed and
+    Day/Class/Subject pre-uppercased, so query loops never re-run
+    strptime/.upper()/.split() on the same strings.
+    """
+    rows = []
+    for item in raw_items:
+        day = item.get("Day") or ""
+        class_name = item.get("Class") or ""
+        subject = (item.get("Subject") or "").strip()
+        subject_upper = subject.upper()
+        start_str = item.get("StartTime") or ""
+        end_str = item.get("EndTime") or ""
+        start_time = parse_hhmm(start_str) if start_str else None
+        end_time = parse_hhmm(end_str) if end_str else None
+        rows.append(TTRow(
+            day=day,
+            class_name=class_name,
+            subject=subject,
+            start_str=start_str,
+            end_str=end_str,
+            period=item.get("Period") or "",
+            day_upper=day.upper(),
+            class_upper=class_name.upper(),
+            subject_upper=subject_upper,
+            subject_parts=tuple(p.strip() for p in subject_upper.split("/")),
+            start_time=start_time,
+            end_time=end_time,
+            start_display=format_time_12hr_from_time(start_time) if start_time else start_str,
+            end_display=format_time_12hr_from_time(end_time) if end_time else end_str,
+            is_break=bool(_BREAK_RE.search(subject_upper)),
+        ))
+    return rows
+
+def _build_day_slots(by_day):
+    """
+    Group each day's rows by (start, end) time slot, chronologically sorted,
+    so get_full_day_schedule never has to regroup or re-sort per call.
+    Rows without parseable times are dropped here, matching the old filter.
+    """
+    day_slots = {}
+    for day_key, rows in by_day.items():
+        slot_map = {}
+        for row in rows:
+            if row.start_time is None or row.end_time is None:
+                continue
+            slot_map.setdefault((row.start_str, row.end_str), []).append(row)
+        day_slots[day_key] = sorted(
+            ((start, end, slot_rows) for (start, end), slot_rows in slot_map.items()),
+            key=lambda slot: slot[2][0].start_time
+        )
+    return day_slots
+
+def _build_class_slots(by_day_class):
+    """
+    Per (day, class): rows with parseable times sorted by start time, plus the
+    parallel start-time list that time-of-day queries bisect over.
+    """
+    class_slots = {}
+    for key, rows in by_day_class.items():
+        timed = sorted(
+            (r for r in rows if r.start_time is not None and r.end_time is not None),
+            key=lambda r: r.start_time
+        )
+        class_slots[key] = (timed, [r.start_time for r in timed])
+    return class_slots
+
+def _build_indexes(rows):
+    """
+    Index rows by day and by (day, class), keyed on the pre-uppercased
+    strings, so queries fetch only the relevant rows instead of scanning
+    (and re-uppercasing) the whole timetable.
+    """
+    by_day = {}
+    by_day_class = {}
+    for row in rows:
+        by_day.setdefault(row.day_upper, []).append(row)
+        by_day_class.setdefault((row.day_upper, row.class_upper), []).append(row)
+    return by_day, by_day_class
+
+@st.cache_resource(show_spinner=False)
+def load_timetable():
+    """
+    Load, preprocess and index the timetable once per process. Streamlit
+    reruns the whole script on every widget interaction; caching here means
+    the JSON parse and the O(N) preprocessing pass happen only on the first run.
+    cache_resource (not cache_data) returns the rows and indexes by reference —
+    they are read-only singletons and pickling TTRow trees would cost more
+    than the load it saves.
+    """
+    rows = _preprocess_timetable(load_data(TIMETABLE_FILE))
+    by_day, by_day_class = _build_indexes(rows)
+    return rows, by_day, by_day_class, _build_day_slots(by_day), _build_class_slots(by_day_class)
+
+@st.cache_data(show_spinner=False)
+def load_assignments_raw():
+    """Initial assignments load; subsequent edits live in st.session_state."""
+    return load_data(TEACHER_ASSIGNMENTS_FILE) or {}
+
+# Load initial data (module level)
+TIMETABLE, BY_DAY, BY_DAY_CLASS, DAY_SLOTS, CLASS_SLOTS = load_timetable()
+
+# Distinct class/subject lists are pure over the immutable timetable, so
+# compute them once at module load rather than per rerun (or per cache fetch)
+ALL_CLASSES = tuple(sorted({row.class_name for row in TIMETABLE if row.class_name}))
+ALL_SUBJECTS = tuple(sorted({row.subject for row in TIMETABLE if row.subject}))
+CLASSES_PREVIEW = ', '.join(ALL_CLASSES[:5]) + ('...' if len(ALL_CLASSES) > 5 else '')
+
+# Computed day schedules, teacher time queries and schedule tables are
+# memoized until the teacher's assignments change. The dicts live behind
+# cache_resource — plain module globals would come back empty on every script
+# run, reducing the memo to within-run dedupe. Keys embed a fingerprint of
+# the session's own view of the teacher's assignments, so two sessions
+# holding different snapshots can never serve each other's results.
+@st.cache_resource(show_spinner=False)
+def _schedule_caches():
+    return {}, {}, {}
+
+_DAY_SCHEDULE_CACHE, _TEACHER_QUERY_CACHE, _SCHEDULE_TABLE_CACHE = _schedule_caches()
+
+def _teacher_assignments_key(teacher_name):
+    """Hashable snapshot of one teacher's assignments, for schedule memo keys."""
+    return tuple(sorted(st.session_state.assignments_index.get(teacher_name, {}).items()))
+
+def _clear_schedule_caches():
+    """Drop memoized schedule results after an assignments edit. The
+    fingerprint keys stay correct regardless; this just bounds growth."""
+    _DAY_SCHEDULE_CACHE.clear()
+    _TEACHER_QUERY_CACHE.clear()
+    _SCHEDULE_TABLE_CACHE.clear()
+
+# Ensure session_state defaults exist before UI code runs
+if "assignments" not in st.session_state:
+    st.session_state.assignments = load_assignments_raw()
+if "assignments_index" not in st.session_state:
+    st.session_state.assignments_index = _build_assignments_index(st.session_state.assignments)
+if "assignments_set" not in st.session_state:
+    st.session_state.assignments_set = _build_assignment_key_sets(st.session_state.assignments)
+if "teacher_names_sorted" not in st.session_state:
+    st.session_state.teacher_names_sorted = sorted(st.session_state.assignments.keys())
+if not _ASSIGNMENTS_SNAPSHOT:
+    _ASSIGNMENTS_SNAPSHOT.update(st.session_state.assignments_index)
+if "reg_teacher_name" not in st.session_state:
+    st.session_state.reg_teacher_name = ""
+if "show_full_schedule" not in st.session_state:
+    st.session_state.show_full_schedule = False
+
 # ----------------- Background Reminder Checker -----------------
+@st.cache_resource(show_spinner=False)
+def get_checker_registry():
+    """
+    Process-wide registry of reminder threads, one per teacher. Living behind
+    st.cache_resource means every session shares the same dict, so switching
+    teachers or opening new tabs no longer spawns duplicate threads.
+    """
+    registry = {}
+
+    def _stop_all():
+        for _, stop_event in registry.values():
+            stop_event.set()
+
+    atexit.register(_stop_all)
+    return registry
+
 def schedule_checker(teacher_name: str, stop_event: Event):
     """
     Background loop that checks the timetable for upcoming classes for `teacher_name`.
@@ -161,62 +471,50 @@ def schedule_checker(teacher_name: str, stop_event: Event):
     """
     while not stop_event.is_set():
         now = get_current_time()
-        # Only check Monday-Friday
-        if now.strftime("%A").upper() not in ("MONDAY", "TUESDAY", "WEDNESDAY", "THURSDAY", "FRIDAY"):
-            stop_event.wait(600)
+        # Only check Monday-Friday; over the weekend, sleep straight through
+        # to Monday 00:00 instead of re-waking every 10 minutes
+        if now.weekday() >= 5:
+            days_ahead = 7 - now.weekday()  # Saturday -> 2, Sunday -> 1
+            next_monday = (now + timedelta(days=days_ahead)).replace(
+                hour=0, minute=0, second=0, microsecond=0
+            )
+            stop_event.wait((next_monday - now).total_seconds())
             continue
+        current_day = _DAYS[now.weekday()]
 
-        # Read latest assignments for this teacher from session_state (so UI updates reflect)
-        assignments_for_teacher = st.session_state.assignments.get(teacher_name, [])
+        # Read the prebuilt class -> subjects index for this teacher from the
+        # module-level snapshot (session_state is off-limits in a thread)
+        assigned_subjects_by_class = _ASSIGNMENTS_SNAPSHOT.get(teacher_name, {})
 
-        # Build mapping: class -> set(subjects)
-        assigned_subjects_by_class = {}
-        for a in assignments_for_teacher:
-            try:
-                cls = a["Class"]
-                subj = a["Subject"].strip().upper()
-                assigned_subjects_by_class.setdefault(cls, set()).add(subj)
-            except Exception:
-                continue
-
-        current_day = now.strftime("%A").upper()
+        notified = False
+        next_reminder_min = None
+        now_min = now.hour * 60 + now.minute
 
-        for item in TIMETABLE:
+        for item in BY_DAY.get(current_day, ()):
             try:
-                if item.get("Day", "").upper() != current_day:
-                    continue
-                class_name = item.get("Class")
-                if not class_name:
-                    continue
-                item_subject_clean = (item.get("Subject") or "").strip().upper()
-                if class_name not in assigned_subjects_by_class:
+                subjects_for_class = assigned_subjects_by_class.get(item.class_name)
+                if not subjects_for_class:
                     continue
 
                 # handle multi-subject cells like "ENG/ELT"
-                is_assigned = False
-                for part in item_subject_clean.split("/"):
-                    if part.strip() in assigned_subjects_by_class[class_name]:
-                        is_assigned = True
-                        break
-                if not is_assigned:
+                if subjects_for_class.isdisjoint(item.subject_parts):
                     continue
 
-                start_time_str = item.get("StartTime")
-                if not start_time_str:
+                if item.start_time is None:
                     continue
-                # Convert to 24-hour for proper time comparison
-                start_time_24hr = convert_to_24hour(start_time_str)
-                start_time_obj = datetime.strptime(start_time_24hr, "%H:%M").time()
-                
-                # Create datetime object in Lagos timezone for comparison
-                start_dt_today = LAGOS_TZ.localize(
-                    datetime.combine(now.date(), start_time_obj)
-                )
-                reminder_time = start_dt_today - timedelta(minutes=NOTIFICATION_WINDOW_MINUTES)
 
-                if reminder_time <= now < start_dt_today:
-                    title = f"🔔 Class Alert ({format_time_12hr(start_time_str)})"
-                    message = f"You have {item.get('Subject','').strip()} with {item.get('Class')} starting in {NOTIFICATION_WINDOW_MINUTES} minutes."
+                # `now` is already Lagos-local, so the window check is pure
+                # minute arithmetic; no per-row tz localization needed
+                start_min = item.start_time.hour * 60 + item.start_time.minute
+                reminder_min = start_min - NOTIFICATION_WINDOW_MINUTES
+
+                if reminder_min > now_min and (next_reminder_min is None or reminder_min < next_reminder_min):
+                    next_reminder_min = reminder_min
+
+                if reminder_min <= now_min < start_min:
+                    notified = True
+                    title = f"🔔 Class Alert ({format_time_12hr_from_time(item.start_time)})"
+                    message = f"You have {item.subject} with {item.class_name} starting in {NOTIFICATION_WINDOW_MINUTES} minutes."
 
                     if PLYER_AVAILABLE:
                         try:
@@ -230,142 +528,154 @@ def schedule_checker(teacher_name: str, stop_event: Event):
             except Exception:
                 continue
 
-        stop_event.wait(60)
+        # Sleep until the next reminder window opens rather than polling every
+        # minute. Keep the old 60s cadence while a window is active (so one
+        # reminder per minute, as before) and cap the idle sleep at 10 minutes
+        # so newly added assignments are still picked up promptly.
+        if notified:
+            stop_event.wait(60)
+        elif next_reminder_min is not None:
+            stop_event.wait(max(5, min(600, (next_reminder_min - now_min) * 60 - now.second)))
+        else:
+            stop_event.wait(600)
 
 # ----------------- Enhanced Schedule & Query Helpers -----------------
+class SlotEntry(NamedTuple):
+    """One block of a teacher's day; attribute access beats dict lookups in
+    the hot rendering/query paths and each entry is far smaller than a dict."""
+    StartTime: object  # datetime.time
+    EndTime: object
+    StartTimeStr: str
+    EndTimeStr: str
+    Type: str  # 'Teaching' | 'Break' | 'Free'
+    Subject: str = ""
+    Class: str = ""
+    Multiple: bool = False
+    Details: tuple = ()
+    TimeSlot: str = ""  # display strings baked at build time so rendering
+    Activity: str = ""  # is a straight column copy with no branching
+
 def get_full_day_schedule(teacher_name, day):
     """
-    Returns a chronological list of time blocks for the day with:
+    Returns a chronological list of SlotEntry blocks for the day with:
       - StartTime (datetime.time)
       - EndTime (datetime.time)
       - Type: 'Teaching'|'Break'|'Free'
       - Subject/Class when applicable
       - Handles multiple classes in same period
     """
-    assignments = st.session_state.assignments.get(teacher_name, [])
     if not TIMETABLE:
         return [], "No timetable data loaded."
 
-    assigned_subjects_by_class = {}
-    for a in assignments:
-        try:
-            assigned_subjects_by_class.setdefault(a["Class"], set()).add(a["Subject"].strip().upper())
-        except Exception:
-            continue
-
-    all_periods_today = [
-        p for p in TIMETABLE
-        if p.get("Day", "").upper() == day.upper() and p.get("StartTime") and p.get("EndTime")
-    ]
-    if not all_periods_today:
-        return [], "No timetable entries for that day."
+    cache_key = (teacher_name, day.upper(), _teacher_assignments_key(teacher_name))
+    cached = _DAY_SCHEDULE_CACHE.get(cache_key)
+    if cached is not None:
+        return cached
 
-    period_map = {}
-    time_slots = set()
-    for p in all_periods_today:
-        key = (p["StartTime"], p["EndTime"])
-        time_slots.add(key)
-        period_map.setdefault(key, []).append(p)
+    assigned_subjects_by_class = st.session_state.assignments_index.get(teacher_name, {})
 
-    try:
-        # Convert to 24-hour format for proper sorting
-        sorted_slots = sorted(list(time_slots), key=lambda x: datetime.strptime(convert_to_24hour(x[0]), "%H:%M").time())
-    except Exception:
-        return [], "Time parsing error in timetable."
+    slots_today = DAY_SLOTS.get(day.upper(), [])
+    if not slots_today:
+        return [], "No timetable entries for that day."
 
     full_schedule = []
-    for start_raw, end_raw in sorted_slots:
-        try:
-            start_time_24hr = convert_to_24hour(start_raw)
-            end_time_24hr = convert_to_24hour(end_raw)
-            start_time_obj = datetime.strptime(start_time_24hr, "%H:%M").time()
-            end_time_obj = datetime.strptime(end_time_24hr, "%H:%M").time()
-        except Exception:
-            continue
-
-        # Check for multiple teaching assignments in the same period
-        teaching_assignments = []
-        for period in period_map.get((start_raw, end_raw), []):
-            class_name = period.get("Class")
-            item_subject_clean = (period.get("Subject") or "").strip().upper()
-            if class_name in assigned_subjects_by_class:
-                for part in item_subject_clean.split("/"):
-                    if part.strip() in assigned_subjects_by_class[class_name]:
-                        teaching_assignments.append({
-                            "Class": class_name,
-                            "Subject": period.get("Subject", "").strip()
-                        })
-                        break
+    for start_raw, end_raw, slot_rows in slots_today:
+        start_time_obj = slot_rows[0].start_time
+        end_time_obj = slot_rows[0].end_time
+        time_slot = f"{slot_rows[0].start_display} - {slot_rows[0].end_display}"
+
+        # Collect teaching assignments for the period, deduplicated at build
+        # time: insertion-ordered dict keyed on (class, subject), valued with
+        # the display pair formatted exactly once
+        teaching_assignments = {}
+        for period in slot_rows:
+            subjects_for_class = assigned_subjects_by_class.get(period.class_name)
+            if subjects_for_class and not subjects_for_class.isdisjoint(period.subject_parts):
+                teaching_assignments.setdefault(
+                    (period.class_name, period.subject),
+                    f"{period.subject} with {period.class_name}"
+                )
 
         if teaching_assignments:
             # Handle multiple classes in same period
             if len(teaching_assignments) == 1:
-                full_schedule.append({
-                    "StartTime": start_time_obj,
-                    "EndTime": end_time_obj,
-                    "StartTimeStr": start_raw,
-                    "EndTimeStr": end_raw,
-                    "Type": "Teaching",
-                    "Class": teaching_assignments[0]["Class"],
-                    "Subject": teaching_assignments[0]["Subject"]
-                })
+                (class_name, subject), = teaching_assignments
+                full_schedule.append(SlotEntry(
+                    start_time_obj, end_time_obj, start_raw, end_raw,
+                    "Teaching", Subject=subject, Class=class_name,
+                    TimeSlot=time_slot,
+                    Activity=f"👨‍🏫 {subject} with {class_name}",
+                ))
             else:
-                # Multiple classes - create a combined entry with proper class-subject pairing
-                class_subject_pairs = []
-                for ta in teaching_assignments:
-                    class_subject_pairs.append(f"{ta['Subject']} with {ta['Class']}")
-                
-                # Remove duplicates while preserving order
-                unique_pairs = []
-                seen = set()
-                for pair in class_subject_pairs:
-                    if pair not in seen:
-                        seen.add(pair)
-                        unique_pairs.append(pair)
-                
-                classes_text = ", ".join(unique_pairs)
-                full_schedule.append({
-                    "StartTime": start_time_obj,
-                    "EndTime": end_time_obj,
-                    "StartTimeStr": start_raw,
-                    "EndTimeStr": end_raw,
-                    "Type": "Teaching",
-                    "Class": "Multiple Classes",
-                    "Subject": classes_text,
-                    "Multiple": True,
-                    "Details": teaching_assignments
-                })
+                # Multiple classes - combined entry with class-subject pairing
+                combined = ", ".join(teaching_assignments.values())
+                full_schedule.append(SlotEntry(
+                    start_time_obj, end_time_obj, start_raw, end_raw,
+                    "Teaching",
+                    Subject=combined,
+                    Class="Multiple Classes",
+                    Multiple=True,
+                    Details=tuple(
+                        {"Class": cls, "Subject": subj} for cls, subj in teaching_assignments
+                    ),
+                    TimeSlot=time_slot,
+                    Activity=f"👨‍🏫 {combined}",
+                ))
         else:
             # Check break/activity keywords
             is_break = False
             break_subject = ""
-            for period in period_map.get((start_raw, end_raw), []):
-                subj = (period.get("Subject") or "").upper()
-                if any(k in subj for k in ("BREAK", "ASSEMBLY", "CLINIC", "TEA", "LIBRARY", "PRACTICAL", "CLUB", "SPORT", "LUNCH", "STUDY", "REMEDIAL")):
+            for period in slot_rows:
+                if period.is_break:
                     is_break = True
-                    break_subject = period.get("Subject", "").strip()
+                    break_subject = period.subject
                     break
             if is_break:
-                full_schedule.append({
-                    "StartTime": start_time_obj,
-                    "EndTime": end_time_obj,
-                    "StartTimeStr": start_raw,
-                    "EndTimeStr": end_raw,
-                    "Type": "Break",
-                    "Subject": break_subject
-                })
+                full_schedule.append(SlotEntry(
+                    start_time_obj, end_time_obj, start_raw, end_raw,
+                    "Break", Subject=break_subject,
+                    TimeSlot=time_slot,
+                    Activity=f"☕ {break_subject or 'Break'}",
+                ))
             else:
-                full_schedule.append({
-                    "StartTime": start_time_obj,
-                    "EndTime": end_time_obj,
-                    "StartTimeStr": start_raw,
-                    "EndTimeStr": end_raw,
-                    "Type": "Free"
-                })
-
-    # Sort by start time
-    final_schedule = sorted(full_schedule, key=lambda x: x["StartTime"])
-    return final_schedule, ""
+                full_schedule.append(SlotEntry(
+                    start_time_obj, end_time_obj, start_raw, end_raw, "Free",
+                    TimeSlot=time_slot,
+                    Activity="✅ FREE PERIOD",
+                ))
+
+    # Slots were built in chronological order already; no status string is
+    # allocated on the happy path (callers only test truthiness)
+    result = (full_schedule, None)
+    _DAY_SCHEDULE_CACHE[cache_key] = result
+    return result
+
+def build_schedule_table(teacher_name, day):
+    """
+    Returns the (DataFrame, status) pair backing the Full Day Schedule table.
+
+    The frame is a pure function of (teacher, day, assignments), so it is
+    memoized next to the day-schedule cache and reruns reuse the same
+    DataFrame object instead of rebuilding rows and activity strings.
+    """
+    cache_key = (teacher_name, day.upper(), _teacher_assignments_key(teacher_name))
+    cached = _SCHEDULE_TABLE_CACHE.get(cache_key)
+    if cached is not None:
+        return cached
+
+    full_schedule, status = get_full_day_schedule(teacher_name, day)
+    if status or not full_schedule:
+        result = (None, status)
+    else:
+        # Display strings were baked into the entries at build time, so the
+        # columns are straight copies with no per-row branching or formatting
+        result = (pd.DataFrame({
+            "Time Slot": [item.TimeSlot for item in full_schedule],
+            "Activity": [item.Activity for item in full_schedule],
+        }), None)
+
+    _SCHEDULE_TABLE_CACHE[cache_key] = result
+    return result
 
 def find_teacher_schedule(teacher_name, day, current_time_str):
     """
@@ -375,34 +685,37 @@ def find_teacher_schedule(teacher_name, day, current_time_str):
     if not TIMETABLE:
         return None, None, "No timetable loaded.", []
 
-    try:
-        # Convert current time to 24-hour format for comparison
-        current_time_24hr = convert_to_24hour(current_time_str)
-        current_time_obj = datetime.strptime(current_time_24hr, "%H:%M").time()
-    except Exception:
+    # Reruns triggered by unrelated widgets repeat the same query; serve those
+    # from the memo (invalidated alongside the day-schedule cache)
+    cache_key = (teacher_name, day.upper(), current_time_str, _teacher_assignments_key(teacher_name))
+    cached = _TEACHER_QUERY_CACHE.get(cache_key)
+    if cached is not None:
+        return cached
+
+    current_time_obj = parse_hhmm(current_time_str)
+    if current_time_obj is None:
         return None, None, "Invalid time format. Use HH:MM.", []
 
     full_schedule, status = get_full_day_schedule(teacher_name, day)
     if status:
         return None, None, status, []
 
-    teaching_periods = [p for p in full_schedule if p["Type"] == "Teaching"]
-    teaching_periods.sort(key=lambda x: x["StartTime"])
+    # full_schedule is already chronological, so current/next are a bisect away
+    teaching_periods = [p for p in full_schedule if p.Type == "Teaching"]
+    starts = [p.StartTime for p in teaching_periods]
 
+    idx = bisect.bisect_right(starts, current_time_obj) - 1
     current_lesson = None
-    next_lesson = None
+    if idx >= 0 and teaching_periods[idx].EndTime > current_time_obj:
+        current_lesson = teaching_periods[idx]
 
-    for lesson in teaching_periods:
-        start = lesson["StartTime"]
-        end = lesson["EndTime"]
-        if start <= current_time_obj < end:
-            current_lesson = lesson
-            continue
-        if start > current_time_obj and next_lesson is None:
-            next_lesson = lesson
+    next_idx = bisect.bisect_right(starts, current_time_obj)
+    next_lesson = teaching_periods[next_idx] if next_idx < len(teaching_periods) else None
 
-    free_periods = [p for p in full_schedule if p["Type"] == "Free"]
-    return current_lesson, next_lesson, "", free_periods
+    free_periods = [p for p in full_schedule if p.Type == "Free"]
+    result = (current_lesson, next_lesson, None, free_periods)
+    _TEACHER_QUERY_CACHE[cache_key] = result
+    return result
 
 # ----------------- FIXED Student/Class Query Functions -----------------
 def get_timetable_query_result(class_name, day, time_str=None):
@@ -414,146 +727,114 @@ def get_timetable_query_result(class_name, day, time_str=None):
     """
     if not class_name or not day:
         return "Please select a Class and Day to check the schedule."
-    
+
     # If no time provided, return full day schedule
     if not time_str:
         return get_full_class_schedule(class_name, day)
-    
-    try:
-        # Convert query time to 24-hour format for comparison
-        query_time_24hr = convert_to_24hour(time_str)
-        query_time = datetime.strptime(query_time_24hr, "%H:%M").time()
-    except Exception:
+
+    query_time = parse_hhmm(time_str)
+    if query_time is None:
         return "Invalid time format. Please use HH:MM (e.g., 09:45)."
 
+    day_display = day_title(day)
+    rows, starts = CLASS_SLOTS.get((day.upper(), class_name.upper()), ((), ()))
+    idx = bisect.bisect_right(starts, query_time) - 1
     found_activities = []
-    for item in TIMETABLE:
-        try:
-            if item.get("Day", "").upper() == day.upper() and item.get("Class", "").upper() == class_name.upper():
-                start_time_24hr = convert_to_24hour(item.get("StartTime", ""))
-                end_time_24hr = convert_to_24hour(item.get("EndTime", ""))
-                start = datetime.strptime(start_time_24hr, "%H:%M").time()
-                end = datetime.strptime(end_time_24hr, "%H:%M").time()
-                if start <= query_time < end:
-                    found_activities.append(item)
-        except Exception:
-            continue
+    if idx >= 0:
+        # Collect every activity sharing the matched slot's start time
+        slot_start = starts[idx]
+        j = idx
+        while j >= 0 and starts[j] == slot_start:
+            if rows[j].end_time > query_time:
+                found_activities.append(rows[j])
+            j -= 1
+        found_activities.reverse()
 
     if found_activities:
         if len(found_activities) == 1:
             activity = found_activities[0]
-            time_display = format_time_period(activity.get('StartTime'), activity.get('EndTime'))
-            subject = activity.get("Subject", "").strip()
+            time_display = f"{activity.start_display} - {activity.end_display}"
             return (
-                f"At **{format_time_12hr(time_str)}** on **{day.title()}** for **{class_name}**:\n\n"
-                f"**Current Activity:** {subject}\n"
+                f"At **{format_time_12hr(time_str)}** on **{day_display}** for **{class_name}**:\n\n"
+                f"**Current Activity:** {activity.subject}\n"
                 f"**Time:** {time_display}\n"
-                f"**Period:** {activity.get('Period', 'N/A')}"
+                f"**Period:** {activity.period or 'N/A'}"
             )
         else:
             # Multiple activities at same time
-            result = f"At **{format_time_12hr(time_str)}** on **{day.title()}** for **{class_name}**:\n\n"
-            result += "**Multiple activities found:**\n"
+            parts = [
+                f"At **{format_time_12hr(time_str)}** on **{day_display}** for **{class_name}**:\n",
+                "**Multiple activities found:**"
+            ]
             for activity in found_activities:
-                time_display = format_time_period(activity.get('StartTime'), activity.get('EndTime'))
-                subject = activity.get("Subject", "").strip()
-                result += f"• {subject} ({time_display})\n"
-            return result
+                parts.append(f"• {activity.subject} ({activity.start_display} - {activity.end_display})")
+            return "\n".join(parts)
     else:
-        return f"No scheduled activity found for **{class_name}** on **{day.title()}** at **{format_time_12hr(time_str)}**."
+        return f"No scheduled activity found for **{class_name}** on **{day_display}** at **{format_time_12hr(time_str)}**."
 
+@st.cache_data(show_spinner=False)
 def get_full_class_schedule(class_name, day):
     """
     Returns the full day schedule for a specific class with correct time formatting
     FIXED: Handles 12-hour format times and sorts chronologically
+    Pure over (class_name, day): cached across reruns.
     """
     if not class_name or not day:
         return "Please select a Class and Day."
-    
-    day_activities = []
-    for item in TIMETABLE:
-        try:
-            if item.get("Day", "").upper() == day.upper() and item.get("Class", "").upper() == class_name.upper():
-                # Get raw times
-                start_time = item.get("StartTime", "")
-                end_time = item.get("EndTime", "")
-                subject = item.get("Subject", "").strip()
-                
-                # Convert 12-hour format times to 24-hour format for proper sorting
-                start_time_24 = convert_to_24hour(start_time)
-                end_time_24 = convert_to_24hour(end_time)
-                
-                # Convert to time objects for proper sorting
-                start_time_obj = datetime.strptime(start_time_24, "%H:%M").time()
-                end_time_obj = datetime.strptime(end_time_24, "%H:%M").time()
-                
-                day_activities.append({
-                    "StartTime": start_time,
-                    "EndTime": end_time,
-                    "StartTimeObj": start_time_obj,
-                    "EndTimeObj": end_time_obj,
-                    "Subject": subject,
-                    "Period": item.get("Period", "")
-                })
-        except Exception as e:
-            continue
+
+    # CLASS_SLOTS rows are already time-filtered and chronologically sorted
+    day_display = day_title(day)
+    day_activities, _ = CLASS_SLOTS.get((day.upper(), class_name.upper()), ((), ()))
 
     if not day_activities:
-        return f"No scheduled activities found for **{class_name}** on **{day.title()}**."
+        return f"No scheduled activities found for **{class_name}** on **{day_display}**."
 
-    # Sort by time using the time objects
-    day_activities.sort(key=lambda x: x["StartTimeObj"])
-    
-    result = f"📅 **Full Schedule for {class_name} on {day.title()}:**\n\n"
+    parts = [f"📅 **Full Schedule for {class_name} on {day_display}:**\n"]
     for activity in day_activities:
-        time_slot = format_time_period(activity['StartTime'], activity['EndTime'])
-        result += f"**{time_slot}**\n"
-        result += f"• **Subject:** {activity['Subject']}\n"
-        if activity.get('Period'):
-            result += f"• **Period:** {activity['Period']}\n"
-        result += "\n"
-    
-    return result
+        parts.append(f"**{activity.start_display} - {activity.end_display}**")
+        parts.append(f"• **Subject:** {activity.subject}")
+        if activity.period:
+            parts.append(f"• **Period:** {activity.period}")
+        parts.append("")
+
+    return "\n".join(parts)
 
+@st.cache_data(show_spinner=False)
 def get_class_subjects_only(class_name, day):
     """
     Returns only the list of subjects for a specific class on a given day
+    Pure over (class_name, day): cached across reruns.
     """
     if not class_name or not day:
         return "Please select a Class and Day."
-    
+
     subjects = set()
-    for item in TIMETABLE:
-        try:
-            if item.get("Day", "").upper() == day.upper() and item.get("Class", "").upper() == class_name.upper():
-                subject = item.get("Subject", "").strip()
-                if subject:
-                    # Handle multi-subject entries
-                    for sub in subject.split("/"):
-                        subjects.add(sub.strip())
-        except Exception:
-            continue
+    for item in BY_DAY_CLASS.get((day.upper(), class_name.upper()), ()):
+        if item.subject:
+            # Handle multi-subject entries
+            for sub in item.subject.split("/"):
+                subjects.add(sub.strip())
 
+    day_display = day_title(day)
     if not subjects:
-        return f"No subjects found for **{class_name}** on **{day.title()}**."
+        return f"No subjects found for **{class_name}** on **{day_display}**."
 
-    subject_list = sorted(list(subjects))
-    result = f"📚 **Subjects for {class_name} on {day.title()}:**\n\n"
-    for i, subject in enumerate(subject_list, 1):
-        result += f"{i}. {subject}\n"
-    
-    return result
+    parts = [f"📚 **Subjects for {class_name} on {day_display}:**\n"]
+    for i, subject in enumerate(sorted(subjects), 1):
+        parts.append(f"{i}. {subject}")
+
+    return "\n".join(parts)
 
 # ----------------- Enhanced Student Query Interface -----------------
 def student_query_interface():
     st.header("📚 Student Timetable Query")
     st.write("Find out what's happening in any class - with or without specific time!")
-    
+
     if not TIMETABLE:
         st.warning("Timetable data failed to load.")
         return
 
-    all_classes = sorted({item.get("Class") for item in TIMETABLE if item.get("Class")})
+    all_classes = ALL_CLASSES
     day_options = ["MONDAY", "TUESDAY", "WEDNESDAY", "THURSDAY", "FRIDAY"]
 
     today_name = get_current_day()
@@ -581,7 +862,7 @@ def student_query_interface():
         time_input = None
 
     st.markdown("---")
-    
+
     if st.button("🔍 Get Information", type="primary", key="get_schedule_btn"):
         if selected_class and selected_day:
             with st.spinner("Fetching schedule information..."):
@@ -591,7 +872,7 @@ def student_query_interface():
                     result = get_full_class_schedule(selected_class, selected_day)
                 else:  # List of subjects only
                     result = get_class_subjects_only(selected_class, selected_day)
-                
+
                 st.success("✅ Query Result:")
                 st.markdown(result)
         else:
@@ -601,17 +882,17 @@ def student_query_interface():
 def teacher_registration():
     st.header("🍎 Teacher Registration & Setup")
     st.write("Register all your classes and manage your teaching assignments.")
-    
+
     if not TIMETABLE:
         st.warning("Timetable data not loaded; cannot register.")
         return
 
-    all_subjects = sorted({(item.get("Subject") or "").strip() for item in TIMETABLE if item.get("Subject")})
-    all_classes = sorted({item.get("Class") for item in TIMETABLE if item.get("Class")})
+    all_subjects = ALL_SUBJECTS
+    all_classes = ALL_CLASSES
 
     # Name input (persisted)
-    st.session_state.reg_teacher_name = st.text_input("1. Your Name", 
-                                                     value=st.session_state.reg_teacher_name, 
+    st.session_state.reg_teacher_name = st.text_input("1. Your Name",
+                                                     value=st.session_state.reg_teacher_name,
                                                      placeholder="Enter your full name",
                                                      key="name_input").strip().title()
     teacher_name = st.session_state.reg_teacher_name
@@ -619,7 +900,7 @@ def teacher_registration():
     if teacher_name:
         st.success(f"Welcome, {teacher_name}! 👋")
         st.subheader(f"2. Your Teaching Assignments")
-        
+
         # Show current assignments
         current_assignments = st.session_state.assignments.get(teacher_name, [])
         if current_assignments:
@@ -636,24 +917,25 @@ def teacher_registration():
                     st.rerun()
         else:
             st.info("No assignments yet. Add your first assignment below!")
-        
+
         # Add new assignment
         with st.form("assignment_form"):
             st.markdown("**Add New Teaching Assignment:**")
             col1, col2 = st.columns(2)
             with col1:
-                selected_class = st.selectbox("Select Class", options=[""] + all_classes, key="reg_class")
+                selected_class = st.selectbox("Select Class", options=[""] + list(all_classes), key="reg_class")
             with col2:
-                selected_subject = st.selectbox("Select Subject", options=[""] + all_subjects, key="reg_subject")
-            
+                selected_subject = st.selectbox("Select Subject", options=[""] + list(all_subjects), key="reg_subject")
+
             register_button = st.form_submit_button("➕ Add This Assignment")
-            
+
             if register_button:
                 if selected_class and selected_subject:
                     st.session_state.assignments.setdefault(teacher_name, [])
-                    new_assignment = {"Class": selected_class, "Subject": selected_subject}
-                    if new_assignment not in st.session_state.assignments[teacher_name]:
-                        st.session_state.assignments[teacher_name].append(new_assignment)
+                    if (selected_class, selected_subject) not in st.session_state.assignments_set.get(teacher_name, ()):
+                        st.session_state.assignments[teacher_name].append(
+                            {"Class": selected_class, "Subject": selected_subject}
+                        )
                         save_assignments(st.session_state.assignments)
                         st.success(f"✅ Added: {selected_subject} for {selected_class}.")
                         st.rerun()
@@ -664,7 +946,7 @@ def teacher_registration():
 
     st.markdown("---")
     st.subheader("All Registered Teachers")
-    teachers = sorted(list(st.session_state.assignments.keys()))
+    teachers = st.session_state.teacher_names_sorted
     if teachers:
         for teacher in teachers:
             assignments_count = len(st.session_state.assignments[teacher])
@@ -672,19 +954,32 @@ def teacher_registration():
     else:
         st.info("No teachers registered yet.")
 
+def render_full_day(teacher_name, day):
+    """Full Day Schedule table; served from the build_schedule_table memo,
+    so reruns only re-emit the cached DataFrame."""
+    schedule_table, status = build_schedule_table(teacher_name, day)
+    st.markdown("---")
+    st.markdown(f"## 📝 Full {day_title(day)} Schedule:")
+    if status:
+        st.warning(status)
+    elif schedule_table is not None:
+        st.dataframe(schedule_table, hide_index=True, use_container_width=True)
+    else:
+        st.info("No activities found for this day.")
+
 def teacher_bot_interface():
     st.header("🗓️ Teacher Timetable Bot")
     st.write("Get personalized schedule information and class reminders!")
-    
+
     # Display current Lagos time
     current_lagos_time = get_current_time()
     st.sidebar.info(f"🕒 **Current Lagos Time:** {current_lagos_time.strftime('%I:%M %p')}")
-    
+
     if not st.session_state.assignments:
         st.warning("No teachers registered yet. Please register in the 'Teacher Setup' tab first.")
         return
 
-    teacher_options = sorted(list(st.session_state.assignments.keys()))
+    teacher_options = st.session_state.teacher_names_sorted
     selected_teacher = st.selectbox("👋 Select your name", options=[""] + teacher_options, key="bot_teacher")
 
     if not selected_teacher:
@@ -693,20 +988,14 @@ def teacher_bot_interface():
     st.success(f"Welcome back, {selected_teacher}! 🎉")
     st.subheader(f"Schedule Query for {selected_teacher}")
 
-    # Thread control: stop previous checker if different teacher
-    if st.session_state.last_checked_teacher != selected_teacher:
-        if st.session_state.checker_stop_event is not None:
-            try:
-                st.session_state.checker_stop_event.set()
-            except Exception:
-                pass
-
+    # Thread control: one shared checker per teacher, reused across sessions
+    registry = get_checker_registry()
+    existing = registry.get(selected_teacher)
+    if existing is None or not existing[0].is_alive():
         stop_event = Event()
-        st.session_state.checker_stop_event = stop_event
         t = Thread(target=schedule_checker, args=(selected_teacher, stop_event), daemon=True)
         t.start()
-        st.session_state.checker_thread = t
-        st.session_state.last_checked_teacher = selected_teacher
+        registry[selected_teacher] = (t, stop_event)
         st.success(f"🔔 Background reminder service activated for {selected_teacher}")
 
     col1, col2 = st.columns(2)
@@ -719,8 +1008,10 @@ def teacher_bot_interface():
         current_time_str = get_current_time_str()
         time_input = st.text_input("⏰ Enter time to check (HH:MM)", value=current_time_str, key="bot_time")
 
+    day_display = DAY_TITLE.get(selected_day, selected_day)
+
     st.markdown("---")
-    if st.button(f"🔍 Show My Full {selected_day.title()} Schedule", type="primary"):
+    if st.button(f"🔍 Show My Full {day_display} Schedule", type="primary"):
         st.session_state.show_full_schedule = True
 
     st.subheader("Schedule Information:")
@@ -730,31 +1021,31 @@ def teacher_bot_interface():
         if status:
             st.info(f"{status}")
         elif current:
-            st.success(f"At {current_time_display} on {selected_day.title()}:")
-            if current.get("Multiple"):
-                st.markdown(f"**You have multiple classes:** {current['Subject']}")
+            st.success(f"At {current_time_display} on {day_display}:")
+            if current.Multiple:
+                st.markdown(f"**You have multiple classes:** {current.Subject}")
             else:
-                st.markdown(f"**Current class:** {current.get('Subject')} with {current.get('Class')}")
+                st.markdown(f"**Current class:** {current.Subject} with {current.Class}")
         else:
             st.info(f"You are currently FREE at {current_time_display}.")
 
         if next_lesson:
             st.warning("Your next lesson:")
-            if next_lesson.get("Multiple"):
-                st.markdown(f"**Multiple classes:** {next_lesson['Subject']} at {format_time_12hr(next_lesson['StartTimeStr'])}")
+            if next_lesson.Multiple:
+                st.markdown(f"**Multiple classes:** {next_lesson.Subject} at {format_time_12hr_from_time(next_lesson.StartTime)}")
             else:
-                st.markdown(f"**{next_lesson.get('Subject')}** with **{next_lesson.get('Class')}** at {format_time_12hr(next_lesson['StartTimeStr'])}")
+                st.markdown(f"**{next_lesson.Subject}** with **{next_lesson.Class}** at {format_time_12hr_from_time(next_lesson.StartTime)}")
         else:
             st.info("No further teaching lessons scheduled for today.")
 
-        try:
-            now_obj = datetime.strptime(convert_to_24hour(time_input), "%H:%M").time()
+        now_obj = parse_hhmm(time_input)
+        if now_obj is not None:
             free_periods_str = [
-                format_time_period(p['StartTimeStr'], p['EndTimeStr'])
+                format_time_period_from_times(p.StartTime, p.EndTime)
                 for p in free_periods
-                if p['EndTime'] > now_obj
+                if p.EndTime > now_obj
             ]
-        except Exception:
+        else:
             free_periods_str = []
 
         if free_periods_str:
@@ -764,34 +1055,11 @@ def teacher_bot_interface():
         st.error("Invalid time format. Please use HH:MM (e.g., 08:30).")
 
     if st.session_state.show_full_schedule:
-        full_schedule, status = get_full_day_schedule(selected_teacher, selected_day)
-        st.markdown("---")
-        st.markdown(f"## 📝 Full {selected_day.title()} Schedule:")
-        if status:
-            st.warning(status)
-        elif full_schedule:
-            schedule_data = []
-            for item in full_schedule:
-                time_slot = format_time_period(item['StartTimeStr'], item['EndTimeStr'])
-                if item["Type"] == "Teaching":
-                    if item.get("Multiple"):
-                        activity = f"👨‍🏫 {item['Subject']}"
-                    else:
-                        activity = f"👨‍🏫 {item['Subject']} with {item['Class']}"
-                elif item["Type"] == "Break":
-                    activity = f"☕ {item.get('Subject', 'Break')}"
-                else:
-                    activity = "✅ FREE PERIOD"
-                schedule_data.append({"Time Slot": time_slot, "Activity": activity})
-            st.table(schedule_data)
-        else:
-            st.info("No activities found for this day.")
+        render_full_day(selected_teacher, selected_day)
 
 # ----------------- Main -----------------
-def main():
-    st.set_page_config(page_title="Sternfield Timetable Bot", layout="wide", page_icon="🏫")
-    st.title("🏫 Sternfield College Timetable Assistant")
-    
+def _render_sidebar():
+    """Sidebar guide and data status."""
     # Add a welcome message with clear navigation
     st.sidebar.success("💡 **Quick Start Guide**")
     st.sidebar.markdown("""
@@ -801,7 +1069,7 @@ def main():
     3. Use **Teacher Bot** for personalized schedule
 
     **For Students:**
-    1. Go to **Student Query** tab  
+    1. Go to **Student Query** tab
     2. Select class and day to view schedule
     3. Choose query type (specific time, full day, or subjects only)
 
@@ -818,14 +1086,19 @@ def main():
     st.sidebar.subheader("📊 Data Status")
     if TIMETABLE:
         st.sidebar.success(f"✅ Timetable: {len(TIMETABLE)} entries loaded")
-        classes = sorted({item.get("Class") for item in TIMETABLE if item.get("Class")})
-        st.sidebar.write(f"**Classes:** {', '.join(classes[:5])}{'...' if len(classes) > 5 else ''}")
+        st.sidebar.write(f"**Classes:** {CLASSES_PREVIEW}")
     else:
         st.sidebar.error("❌ Timetable: No data loaded")
-    
+
     teachers_count = len(st.session_state.assignments)
     st.sidebar.info(f"👨‍🏫 Teachers: {teachers_count} registered")
 
+def main():
+    st.set_page_config(page_title="Sternfield Timetable Bot", layout="wide", page_icon="🏫")
+    st.title("🏫 Sternfield College Timetable Assistant")
+
+    _render_sidebar()
+
     # Simplified tabs - removed chat assistant
     tab1, tab2, tab3 = st.tabs(["Teacher Bot 🤖", "Teacher Setup 📝", "Student Timetable Query 📚"])
     with tab1:
@@ -836,4 +1109,4 @@ def main():
         student_query_interface()
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()